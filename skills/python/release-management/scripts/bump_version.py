@@ -9,31 +9,48 @@ Usage:
 """
 
 import argparse
+import functools
+import os
 import re
 import sys
 from datetime import date
 from pathlib import Path
+from re import Pattern
 
 BUMP_TYPES = ("major", "minor", "patch")
 
+# ASCII-only, so digits int() can't parse (e.g. "²") are rejected up front.
+_VERSION_FORMAT = re.compile(r'(\d+)\.(\d+)\.(\d+)', re.ASCII)
+
+# Compiled once at import; update_version() reuses them for every file it visits.
+# The pyproject pattern is anchored so python_version or target-version don't match;
+# an indented key keeps its indent.
+_VERSION_PYPROJECT = re.compile(r'(?m)^(?P<indent>[ \t]*)version\s*=\s*"(?P<version>[^"]+)"')
+_VERSION_INIT = re.compile(r'__version__\s*=\s*"[^"]+"')
+# setup.cfg is legacy; match only the metadata version line.
+_VERSION_SETUPCFG = re.compile(r'(?m)^version\s*=\s*[\d.]+[ \t]*$')
+_UNRELEASED_HEADING = re.compile(r'(?m)^(##\s*\[Unreleased\].*)$')
+
 
 def get_current_version(project_path: Path) -> str | None:
     """Get current version from pyproject.toml."""
     pyproject = project_path / "pyproject.toml"
-    if not pyproject.exists():
+    try:
+        content = pyproject.read_text()
+    except FileNotFoundError:
         return None
-
-    content = pyproject.read_text()
-    match = re.search(r'version\s*=\s*"([^"]+)"', content)
-    return match.group(1) if match else None
+    match = _VERSION_PYPROJECT.search(content)
+    return match.group("version") if match else None
 
 
+@functools.lru_cache(maxsize=128)
 def parse_version(version: str) -> tuple[int, int, int]:
     """Parse a semantic version string into a (major, minor, patch) tuple."""
-    parts = version.split(".")
-    if len(parts) != 3 or not all(p.isdigit() for p in parts):
+    match = _VERSION_FORMAT.fullmatch(version)
+    if match is None:
         raise ValueError(f"Invalid version format: {version!r} (expected MAJOR.MINOR.PATCH)")
-    return int(parts[0]), int(parts[1]), int(parts[2])
+    major, minor, patch = match.groups()
+    return int(major), int(minor), int(patch)
 
 
 def bump_version(current: str, spec: str) -> str:
@@ -53,22 +70,41 @@ def bump_version(current: str, spec: str) -> str:
 
 def update_file(
     file_path: Path,
-    pattern: str,
+    pattern: Pattern[str],
     replacement: str,
     dry_run: bool = False,
 ) -> bool:
-    """Update version in a file using regex."""
-    if not file_path.exists():
-        return False
-
-    content = file_path.read_text()
-    new_content = re.sub(pattern, replacement, content)
+    """Replace the first match of pattern in a file with replacement.
 
-    if content == new_content:
+    Like re.sub(), the replacement may refer to the match's groups.
+    """
+    try:
+        data = file_path.read_bytes()
+    except FileNotFoundError:
+        return False
+    # Decode without newline translation so match offsets map onto the bytes
+    # on disk and CRLF files keep their line endings.
+    content = data.decode("utf-8")
+    # Only the first match is the version line; splice it in directly rather
+    # than letting re.sub rescan the rest of the file.
+    match = pattern.search(content)
+    if match is None:
+        return False
+    replacement = match.expand(replacement)
+    if match.group(0) == replacement:
         return False
 
     if not dry_run:
-        file_path.write_text(new_content)
+        start = len(content[:match.start()].encode("utf-8"))
+        end = start + len(match.group(0).encode("utf-8"))
+        new = replacement.encode("utf-8")
+        if len(new) == end - start:
+            # Same length (e.g. 1.2.3 -> 1.2.4): overwrite just those bytes in place.
+            with file_path.open("r+b") as f:
+                f.seek(start)
+                f.write(new)
+        else:
+            file_path.write_bytes(data[:start] + new + data[end:])
 
     return True
 
@@ -85,29 +121,40 @@ def update_version(
     pyproject = project_path / "pyproject.toml"
     if update_file(
         pyproject,
-        r'version\s*=\s*"[^"]+"',
-        f'version = "{new_version}"',
+        _VERSION_PYPROJECT,
+        rf'\g<indent>version = "{new_version}"',
         dry_run,
     ):
         updated_files.append(str(pyproject))
 
     # Top-level package __init__.py (src/<package>/__init__.py), not every subpackage.
+    # One os.scandir of src/ is cheaper than pathlib globbing; hidden dirs and
+    # caches are skipped.
     src = project_path / "src"
     if src.is_dir():
-        for init_file in src.glob("*/__init__.py"):
+        with os.scandir(src) as entries:
+            packages = sorted(
+                entry.name
+                for entry in entries
+                if entry.is_dir()
+                and not entry.name.startswith(".")
+                and entry.name != "__pycache__"
+            )
+        for package in packages:
+            init_file = src / package / "__init__.py"
             if update_file(
                 init_file,
-                r'__version__\s*=\s*"[^"]+"',
+                _VERSION_INIT,
                 f'__version__ = "{new_version}"',
                 dry_run,
             ):
                 updated_files.append(str(init_file))
 
-    # setup.cfg (legacy; match only the metadata version line)
+    # setup.cfg (legacy)
     setup_cfg = project_path / "setup.cfg"
     if update_file(
         setup_cfg,
-        r'(?m)^version\s*=\s*[\d.]+\s*$',
+        _VERSION_SETUPCFG,
         f'version = {new_version}',
         dry_run,
     ):
@@ -123,11 +170,11 @@ def update_changelog(
 ) -> bool:
     """Insert a new release heading under the [Unreleased] section of the changelog."""
     changelog = project_path / "CHANGELOG.md"
-    if not changelog.exists():
+    try:
+        content = changelog.read_text()
+    except FileNotFoundError:
         return False
 
-    content = changelog.read_text()
-
     # Already released: leave the file untouched so retried releases don't
     # insert a second heading for the same version.
     if re.search(rf'(?m)^##\s*\[?{re.escape(new_version)}\]?(?![\w.\-])', content):
@@ -137,8 +184,7 @@ def update_changelog(
 
     # Match the [Unreleased] heading only (not the [Unreleased]: link reference
     # at the bottom of the file), and insert the new version heading after it.
-    new_content = re.sub(
-        r'(?m)^(##\s*\[Unreleased\].*)$',
+    new_content = _UNRELEASED_HEADING.sub(
         rf'\1\n\n## [{new_version}] - {today}',
         content,
         count=1,
@@ -11,10 +11,17 @@ Usage:
 """
 
 import argparse
+import configparser
+import functools
+import io
 import json
+import os
+import re
+import shutil
 import subprocess
 import sys
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
 # A scanner that hasn't finished within this window is treated as hung rather
@@ -24,8 +31,31 @@ SCAN_TIMEOUT = 300  # seconds
 # Cap per-tool findings printed to the console; the full set still goes to --output.
 MAX_FINDINGS_SHOWN = 10
 
+# Bandit severities that fail the run.
+BANDIT_BLOCKING_SEVERITIES = frozenset({"HIGH", "CRITICAL"})
 
-@dataclass
+# Environments, dependencies and build output rather than project source; the
+# scanners that walk the tree themselves are told to skip them.
+SCAN_EXCLUDE_DIRS = (
+    ".venv", "venv", "node_modules", "build", "dist", ".git",
+    "__pycache__", ".mypy_cache", ".ruff_cache", ".tox", ".nox",
+)
+
+# detect-secrets --exclude-files regex matching any path inside SCAN_EXCLUDE_DIRS.
+_SECRETS_EXCLUDE_FILES = rf"(^|/)({'|'.join(map(re.escape, SCAN_EXCLUDE_DIRS))})/"
+
+# Bandit's own -x default, which passing -x replaces.
+BANDIT_DEFAULT_EXCLUDES = (
+    ".svn", "CVS", ".bzr", ".hg", ".git", "__pycache__", ".tox", ".eggs", "*.egg",
+)
+
+# .bandit options the in-process run applies itself. Any other option sends the
+# scan to the CLI so both paths agree. The CLI ignores "targets" whenever a
+# target is given on the command line, as run_bandit() always does.
+BANDIT_INI_IN_PROCESS_OPTIONS = frozenset({"skips", "tests", "exclude", "targets"})
+
+
+@dataclass(slots=True)
 class ScanResult:
     tool: str
     success: bool
@@ -34,15 +64,33 @@ class ScanResult:
     error: str | None = None
 
 
-def _run(cmd: list[str], tool: str, install_hint: str, ok_returncodes=(0, 1)):
-    """Run a scanner subprocess.
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str | None:
+    """Look a scanner up on PATH once per process; None if it isn't installed.
+
+    A relative PATH entry makes shutil.which() return a relative path, which
+    would resolve against a scanner's cwd instead, so the result is made absolute.
+    """
+    path = shutil.which(name)
+    return os.path.abspath(path) if path else None
+
+
+def _run(cmd: list[str], tool: str, install_hint: str, empty, ok_returncodes=(0, 1), cwd=None):
+    """Run a scanner subprocess and parse its JSON output.
 
-    Returns (stdout, None) on success or (None, ScanResult) describing why the
-    tool could not run — so callers never crash on a missing or hung scanner.
+    Returns (data, None) on success — ``empty`` when the tool printed nothing —
+    or (None, ScanResult) describing why the tool could not run or its output
+    could not be read, so callers never crash on a missing or hung scanner.
     """
+    exe = _resolve_executable(cmd[0])
+    if exe is None:
+        return None, ScanResult(tool, False, error=f"{tool} not installed. Run: {install_hint}")
+
     try:
+        # Capture raw bytes: json.loads() decodes them itself, so text mode
+        # would only add a decode and newline-translation pass over the output.
         result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=SCAN_TIMEOUT
+            [exe, *cmd[1:]], capture_output=True, timeout=SCAN_TIMEOUT, cwd=cwd
         )
     except FileNotFoundError:
         return None, ScanResult(tool, False, error=f"{tool} not installed. Run: {install_hint}")
@@ -52,10 +100,110 @@ def _run(cmd: list[str], tool: str, install_hint: str, ok_returncodes=(0, 1)):
         return None, ScanResult(tool, False, error=str(e))
 
     if result.returncode not in ok_returncodes:
-        return None, ScanResult(
-            tool, False, error=result.stderr.strip() or f"exit code {result.returncode}"
-        )
-    return result.stdout, None
+        stderr = result.stderr.decode(errors="replace").strip()
+        return None, ScanResult(tool, False, error=stderr or f"exit code {result.returncode}")
+    if not result.stdout:
+        return empty, None
+    try:
+        return json.loads(result.stdout), None
+    except ValueError as e:
+        return None, ScanResult(tool, False, error=f"could not parse {tool} output: {e}")
+
+
+def _bandit_excludes(target: Path, extra: str | None = None) -> str:
+    """Build Bandit's exclusion list for a scan of target.
+
+    Bandit substring-matches exclusions against full paths, so a bare "build"
+    would also drop e.g. builders.py; SCAN_EXCLUDE_DIRS are passed as the
+    absolute paths of the ones that exist under target instead. ``extra`` is a
+    comma-separated list to append, such as a .bandit file's ``exclude``.
+    """
+    excluded_dirs = (target / name for name in SCAN_EXCLUDE_DIRS)
+    excludes = [*BANDIT_DEFAULT_EXCLUDES, *(str(d) for d in excluded_dirs if d.is_dir())]
+    if extra:
+        excludes.extend(extra.split(","))
+    return ",".join(excludes)
+
+
+def _find_bandit_ini(target: Path) -> list[str]:
+    """Find project-level .bandit files under target, the way the bandit CLI does."""
+    return [
+        os.path.join(root, ".bandit")
+        for root, _, filenames in os.walk(target)
+        if ".bandit" in filenames
+    ]
+
+
+def _bandit_ini_exclude(ini_files: list[str]) -> str | None:
+    """Read the ``exclude`` option of a project .bandit file.
+
+    Any -x that differs from Bandit's default overrides the file's exclude, so
+    run_bandit() carries it over onto its own -x list.
+    """
+    if len(ini_files) != 1:
+        return None
+    parser = configparser.ConfigParser()
+    try:
+        parser.read(ini_files[0])
+        return parser.get("bandit", "exclude", fallback=None)
+    except configparser.Error:
+        return None
+
+
+def _bandit_available() -> bool:
+    """Whether Bandit can run at all, either imported here or as a CLI on PATH."""
+    try:
+        import bandit  # noqa: F401
+    except ImportError:
+        return _resolve_executable("bandit") is not None
+    return True
+
+
+def _bandit_in_process(target: Path, ini_files: list[str]) -> list[dict] | None:
+    """Run Bandit through its Python API, skipping a second interpreter start-up.
+
+    Applies a project .bandit file's skips, tests and exclude like the CLI.
+    Returns None when Bandit isn't importable here (e.g. it was installed with
+    ``uv tool install``) or the .bandit setup needs the CLI, so the caller
+    falls back to it.
+    """
+    try:
+        from bandit.core import config, docs_utils, extension_loader, manager, utils
+    except ImportError:
+        return None
+
+    ini_options = {}
+    if len(ini_files) > 1:
+        return None  # the CLI refuses to pick one and reports the conflict
+    if ini_files:
+        ini_options = utils.parse_ini_file(ini_files[0]) or {}
+        if set(ini_options) - BANDIT_INI_IN_PROCESS_OPTIONS:
+            return None
+
+    b_conf = config.BanditConfig()
+    profile = {
+        "include": set(b_conf.get_option("tests") or []),
+        "exclude": set(b_conf.get_option("skips") or []),
+    }
+    if ini_options.get("tests"):
+        profile["include"].update(ini_options["tests"].split(","))
+    if ini_options.get("skips"):
+        profile["exclude"].update(ini_options["skips"].split(","))
+    extension_loader.MANAGER.validate_profile(profile)
+
+    b_mgr = manager.BanditManager(b_conf, "file", quiet=True, profile=profile)
+    b_mgr.discover_files(
+        [str(target)],
+        recursive=True,
+        excluded_paths=_bandit_excludes(target, ini_options.get("exclude")),
+    )
+    b_mgr.run_tests()
+    findings = []
+    for issue in b_mgr.get_issue_list():
+        finding = issue.as_dict()
+        finding["more_info"] = docs_utils.get_url(finding["test_id"])
+        findings.append(finding)
+    return findings
 
 
 def run_bandit(project_path: Path) -> ScanResult:
@@ -64,33 +212,49 @@ def run_bandit(project_path: Path) -> ScanResult:
     if not target.exists():
         target = project_path
 
-    stdout, err = _run(
-        ["bandit", "-r", str(target), "-f", "json"],
-        "bandit",
-        "uv tool install bandit",
-    )
-    if err:
-        return err
+    # Finding .bandit files walks the whole target, so skip it when Bandit is
+    # missing and _run() is about to report that anyway.
+    ini_files = _find_bandit_ini(target) if _bandit_available() else []
+    try:
+        findings = _bandit_in_process(target, ini_files)
+    except Exception as e:  # noqa: BLE001 - report a Bandit failure, don't crash the run
+        return ScanResult("bandit", False, error=str(e))
+
+    if findings is None:
+        cmd = [
+            "bandit", "-r", str(target), "-f", "json",
+            "-x", _bandit_excludes(target, _bandit_ini_exclude(ini_files)),
+        ]
+        if len(ini_files) == 1:
+            # Hand over the file already found so Bandit doesn't walk the tree for it again.
+            cmd += ["--ini", ini_files[0]]
+        data, err = _run(
+            cmd,
+            "bandit",
+            "uv tool install bandit",
+            empty={"results": []},
+        )
+        if err:
+            return err
+        findings = data.get("results", [])
 
-    data = json.loads(stdout) if stdout else {"results": []}
-    findings = data.get("results", [])
     blocking = sum(
-        1 for f in findings if f.get("issue_severity", "").upper() in ("HIGH", "CRITICAL")
+        1 for f in findings if f.get("issue_severity", "").upper() in BANDIT_BLOCKING_SEVERITIES
     )
     return ScanResult("bandit", True, findings, blocking)
 
 
 def run_pip_audit(project_path: Path) -> ScanResult:
     """Audit the target project's dependencies. Blocks on any vulnerable package."""
-    stdout, err = _run(
+    data, err = _run(
         ["pip-audit", "--format", "json", str(project_path)],
         "pip-audit",
         "uv tool install pip-audit",
+        empty=[],
     )
     if err:
         return err
 
-    data = json.loads(stdout) if stdout else []
     # pip-audit returns either a bare list or {"dependencies": [...]} across versions.
     deps = data.get("dependencies", []) if isinstance(data, dict) else data
     findings = [d for d in deps if d.get("vulns")]
@@ -99,15 +263,15 @@ def run_pip_audit(project_path: Path) -> ScanResult:
 
 def run_semgrep(project_path: Path) -> ScanResult:
     """Run Semgrep pattern-based SAST. Blocks on ERROR-severity findings."""
-    stdout, err = _run(
+    data, err = _run(
         ["semgrep", "--config", "auto", "--json", "--quiet", str(project_path)],
         "semgrep",
         "uv tool install semgrep",
+        empty={"results": []},
     )
     if err:
         return err
 
-    data = json.loads(stdout) if stdout else {"results": []}
     findings = data.get("results", [])
     blocking = sum(
         1 for f in findings if f.get("extra", {}).get("severity", "").upper() == "ERROR"
@@ -117,15 +281,23 @@ def run_semgrep(project_path: Path) -> ScanResult:
 
 def check_secrets(project_path: Path) -> ScanResult:
     """Check for hardcoded secrets. Any detected secret blocks the run."""
-    stdout, err = _run(
-        ["detect-secrets", "scan", str(project_path)],
+    # By default detect-secrets scans only what `git ls-files` lists, which is
+    # nothing when the project sits below the repository root (e.g. a monorepo
+    # package). --all-files walks the project instead, and --exclude-files keeps
+    # it out of environments and build output.
+    data, err = _run(
+        [
+            "detect-secrets", "scan", "--all-files",
+            "--exclude-files", _SECRETS_EXCLUDE_FILES, ".",
+        ],
         "detect-secrets",
         "uv tool install detect-secrets",
+        empty={"results": {}},
+        cwd=project_path,
     )
     if err:
         return err
 
-    data = json.loads(stdout) if stdout else {"results": {}}
     findings = [
         {"file": file_path, "type": secret.get("type"), "line": secret.get("line_number")}
         for file_path, secrets in data.get("results", {}).items()
@@ -134,58 +306,94 @@ def check_secrets(project_path: Path) -> ScanResult:
     return ScanResult("detect-secrets", True, findings, blocking=len(findings))
 
 
+def _describe_bandit(finding: dict) -> str:
+    get = finding.get
+    return (
+        f"[{get('issue_severity', 'UNKNOWN')}] {get('issue_text', '')} "
+        f"({get('filename', 'unknown')})"
+    )
+
+
+def _describe_pip_audit(finding: dict) -> str:
+    get = finding.get
+    ids = ", ".join(v.get("id", "?") for v in get("vulns", []))
+    return f"{get('name')} {get('version', '')}: {ids}"
+
+
+def _describe_semgrep(finding: dict) -> str:
+    get = finding.get
+    line = get("start", {}).get("line", "?")
+    sev = get("extra", {}).get("severity", "INFO")
+    return f"[{sev}] {get('check_id')} ({get('path', 'unknown')}:{line})"
+
+
+def _describe_secret(finding: dict) -> str:
+    get = finding.get
+    return f"{get('type', 'Secret')} in {get('file')}:{get('line', '?')}"
+
+
+# Each tool's findings carry a distinguishing key; checked in this order.
+_DESCRIBERS = {
+    "issue_text": _describe_bandit,
+    "vulns": _describe_pip_audit,
+    "check_id": _describe_semgrep,
+    "file": _describe_secret,
+}
+
+
 def _describe(finding) -> str:
     """Render a single finding as one line, across the tools' differing shapes."""
     if not isinstance(finding, dict):
         return str(finding)
-    if "issue_text" in finding:  # bandit
-        return (
-            f"[{finding.get('issue_severity', 'UNKNOWN')}] {finding.get('issue_text', '')} "
-            f"({finding.get('filename', 'unknown')})"
-        )
-    if "vulns" in finding:  # pip-audit
-        ids = ", ".join(v.get("id", "?") for v in finding.get("vulns", []))
-        return f"{finding.get('name')} {finding.get('version', '')}: {ids}"
-    if "check_id" in finding:  # semgrep
-        path = finding.get("path", "unknown")
-        line = finding.get("start", {}).get("line", "?")
-        sev = finding.get("extra", {}).get("severity", "INFO")
-        return f"[{sev}] {finding.get('check_id')} ({path}:{line})"
-    if "file" in finding:  # detect-secrets
-        return f"{finding.get('type', 'Secret')} in {finding.get('file')}:{finding.get('line', '?')}"
-    return str(finding)
+    describe = next((fn for key, fn in _DESCRIBERS.items() if key in finding), str)
+    return describe(finding)
 
 
 def format_report(results: list[ScanResult]) -> str:
     """Format scan results as a readable report."""
-    lines = ["=" * 60, "Security Scan Report", "=" * 60, ""]
+    buf = io.StringIO()
+    w = buf.write
+    w("=" * 60 + "\nSecurity Scan Report\n" + "=" * 60 + "\n\n")
     total_findings = 0
     total_blocking = 0
 
     for result in results:
-        lines.append(f"## {result.tool.upper()}")
-        lines.append("-" * 40)
+        w(f"## {result.tool.upper()}\n")
+        w("-" * 40 + "\n")
 
         if not result.success:
-            lines.append(f"Error: {result.error}")
+            w(f"Error: {result.error}\n")
         elif not result.findings:
-            lines.append("No issues found.")
+            w("No issues found.\n")
         else:
-            lines.append(f"Found {len(result.findings)} issue(s), {result.blocking} blocking:")
+            w(f"Found {len(result.findings)} issue(s), {result.blocking} blocking:\n")
             for i, finding in enumerate(result.findings[:MAX_FINDINGS_SHOWN], 1):
-                lines.append(f"  {i}. {_describe(finding)}")
+                w(f"  {i}. {_describe(finding)}\n")
             if len(result.findings) > MAX_FINDINGS_SHOWN:
-                lines.append(f"  ... and {len(result.findings) - MAX_FINDINGS_SHOWN} more")
+                w(f"  ... and {len(result.findings) - MAX_FINDINGS_SHOWN} more\n")
             total_findings += len(result.findings)
             total_blocking += result.blocking
 
-        lines.append("")
+        w("\n")
+
+    w("=" * 60 + "\n")
+    w(f"Total findings: {total_findings} ({total_blocking} blocking)\n")
+    w("=" * 60)
 
-    lines.append("=" * 60)
-    lines.append(f"Total findings: {total_findings} ({total_blocking} blocking)")
-    lines.append("=" * 60)
+    return buf.getvalue()
 
-    return "\n".join(lines)
+
+def _write_json(path: Path, data) -> None:
+    """Write data as indented JSON, using orjson when it's installed."""
+    try:
+        import orjson
+    except ImportError:
+        # Stream the encoder's chunks through a large write buffer rather than
+        # building the whole indented document as one string first.
+        with path.open("w", encoding="utf-8", buffering=65536) as f:
+            json.dump(data, f, indent=2)
+    else:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 def main():
@@ -226,12 +434,14 @@ def main():
         ("secrets", lambda: check_secrets(project_path)),
     ]
 
-    results = []
-    for name, runner in scanners:
-        if name in args.skip:
-            continue
+    selected = [(name, runner) for name, runner in scanners if name not in args.skip]
+    for name, _ in selected:
         print(f"Running {name}...")
-        results.append(runner())
+
+    # Each scanner is an independent subprocess, so run them concurrently; map()
+    # keeps the results in the fixed order above for the report.
+    with ThreadPoolExecutor(max_workers=max(len(selected), 1)) as executor:
+        results = list(executor.map(lambda scanner: scanner[1](), selected))
 
     print()
     print(format_report(results))
@@ -239,18 +449,11 @@ def main():
     if args.output:
         report_data = {
             "project": str(project_path),
-            "results": [
-                {
-                    "tool": r.tool,
-                    "success": r.success,
-                    "findings": r.findings,
-                    "blocking": r.blocking,
-                    "error": r.error,
-                }
-                for r in results
-            ],
+            # Shallow per-field dicts: dataclasses.asdict() would deep-copy
+            # every finding just to serialize it.
+            "results": [{f.name: getattr(r, f.name) for f in fields(r)} for r in results],
         }
-        args.output.write_text(json.dumps(report_data, indent=2))
+        _write_json(args.output, report_data)
         print(f"\nJSON report saved to: {args.output}")
 
     # Fail the run if any scanner reported a blocking finding (HIGH/CRITICAL code
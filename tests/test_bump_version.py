@@ -40,6 +40,20 @@ CHANGELOG = """\
 """
 
 
+class BumpVersionTests(unittest.TestCase):
+    def test_bump_types(self):
+        self.assertEqual(BUMP_VERSION.bump_version("1.2.3", "patch"), "1.2.4")
+        self.assertEqual(BUMP_VERSION.bump_version("1.2.3", "minor"), "1.3.0")
+        self.assertEqual(BUMP_VERSION.bump_version("1.2.3", "major"), "2.0.0")
+        self.assertEqual(BUMP_VERSION.bump_version("1.2.3", "1.10.0"), "1.10.0")
+
+    def test_invalid_versions_are_rejected(self):
+        for version in ("1.2", "1.2.3.4", "v1.2.3", "1.2.x", "1.2.3\n", "1.2.\u00b2"):
+            with self.subTest(version=version):
+                with self.assertRaisesRegex(ValueError, "Invalid version format"):
+                    BUMP_VERSION.parse_version(version)
+
+
 class UpdateChangelogTests(unittest.TestCase):
     def setUp(self):
         self.temp_dir = tempfile.TemporaryDirectory()
@@ -93,5 +107,109 @@ class UpdateChangelogTests(unittest.TestCase):
         self.assertEqual(len(self.headings("1.2.30")), 1)
 
 
+class UpdateVersionTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.project = Path(self.temp_dir.name)
+        (self.project / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\nversion = "1.2.3"\n'
+        )
+        self.package = self.project / "src" / "demo"
+        self.package.mkdir(parents=True)
+        (self.package / "__init__.py").write_text('__version__ = "1.2.3"\n')
+
+    def test_updates_pyproject_and_package_init(self):
+        updated = BUMP_VERSION.update_version(self.project, "1.3.0")
+
+        self.assertEqual(
+            sorted(updated),
+            sorted([str(self.project / "pyproject.toml"), str(self.package / "__init__.py")]),
+        )
+        self.assertEqual(BUMP_VERSION.get_current_version(self.project), "1.3.0")
+        self.assertEqual(
+            (self.package / "__init__.py").read_text(), '__version__ = "1.3.0"\n'
+        )
+
+    def test_other_version_keys_in_pyproject_are_left_alone(self):
+        pyproject = self.project / "pyproject.toml"
+        for indent in ("", "  "):
+            with self.subTest(indent=indent):
+                pyproject.write_text(
+                    f'[project]\nname = "demo"\n{indent}version = "1.2.3"\n\n'
+                    '[tool.ruff]\ntarget-version = "py310"\n\n'
+                    '[tool.mypy]\npython_version = "3.10"\n'
+                )
+
+                self.assertEqual(BUMP_VERSION.get_current_version(self.project), "1.2.3")
+                BUMP_VERSION.update_version(self.project, "1.3.0")
+
+                self.assertEqual(
+                    pyproject.read_text(),
+                    f'[project]\nname = "demo"\n{indent}version = "1.3.0"\n\n'
+                    '[tool.ruff]\ntarget-version = "py310"\n\n'
+                    '[tool.mypy]\npython_version = "3.10"\n',
+                )
+
+    def test_crlf_line_endings_are_preserved(self):
+        pyproject = self.project / "pyproject.toml"
+        pyproject.write_bytes(b'[project]\r\nname = "demo"\r\nversion = "1.2.3"\r\n')
+
+        for version in ("1.2.4", "1.10.0"):
+            with self.subTest(version=version):
+                BUMP_VERSION.update_version(self.project, version)
+                self.assertEqual(
+                    pyproject.read_bytes(),
+                    f'[project]\r\nname = "demo"\r\nversion = "{version}"\r\n'.encode(),
+                )
+
+    def test_non_ascii_content_before_the_version_is_kept(self):
+        pyproject = self.project / "pyproject.toml"
+        pyproject.write_text(
+            '[project]\ndescription = "Café ☕"\nversion = "1.2.3"\n', encoding="utf-8"
+        )
+
+        BUMP_VERSION.update_version(self.project, "1.2.4")
+
+        self.assertEqual(
+            pyproject.read_text(encoding="utf-8"),
+            '[project]\ndescription = "Café ☕"\nversion = "1.2.4"\n',
+        )
+
+    def test_unchanged_version_is_not_reported(self):
+        self.assertEqual(BUMP_VERSION.update_version(self.project, "1.2.3"), [])
+
+    def test_subpackages_and_hidden_dirs_are_not_updated(self):
+        subpackage = self.package / "sub"
+        hidden = self.project / "src" / ".cache"
+        for directory in (subpackage, hidden):
+            directory.mkdir()
+            (directory / "__init__.py").write_text('__version__ = "1.2.3"\n')
+
+        updated = BUMP_VERSION.update_version(self.project, "1.3.0")
+
+        self.assertEqual(len(updated), 2)
+        for directory in (subpackage, hidden):
+            self.assertEqual(
+                (directory / "__init__.py").read_text(), '__version__ = "1.2.3"\n'
+            )
+
+    def test_dry_run_leaves_files_untouched(self):
+        updated = BUMP_VERSION.update_version(self.project, "1.2.4", dry_run=True)
+
+        self.assertEqual(len(updated), 2)
+        self.assertEqual(BUMP_VERSION.get_current_version(self.project), "1.2.3")
+
+    def test_setup_cfg_metadata_version_is_updated(self):
+        setup_cfg = self.project / "setup.cfg"
+        setup_cfg.write_text("[metadata]\nname = demo\nversion = 1.2.3\n")
+
+        BUMP_VERSION.update_version(self.project, "2.0.0")
+
+        self.assertEqual(
+            setup_cfg.read_text(), "[metadata]\nname = demo\nversion = 2.0.0\n"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
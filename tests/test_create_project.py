@@ -74,6 +74,24 @@ class CreateProjectTests(unittest.TestCase):
         for python_file in project.rglob("*.py"):
             py_compile.compile(python_file, doraise=True)
 
+    def test_generated_files_are_utf8_encoded(self):
+        project = CREATE_PROJECT.create_project("unicode-lib", author="Zoë Ångström")
+
+        with (project / "pyproject.toml").open("rb") as file:
+            metadata = tomllib.load(file)["project"]
+        self.assertEqual(metadata["authors"][0]["name"], "Zoë Ångström")
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_generated_files_follow_the_umask(self):
+        previous_umask = os.umask(0o002)
+        try:
+            project = CREATE_PROJECT.create_project("shared-lib")
+        finally:
+            os.umask(previous_umask)
+
+        self.assertEqual((project / "README.md").stat().st_mode & 0o777, 0o664)
+        self.assertEqual((project / "tests").stat().st_mode & 0o777, 0o775)
+
     def test_generated_python_files_end_with_single_newline(self):
         project = CREATE_PROJECT.create_project("sample-lib")
 